@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -6,15 +7,16 @@ from typing import Any
 import httpx
 
 from src.api.dataviews import DataViewsAPI, DataViewSpec
-from src.api.http import KibanaAuth, KibanaHTTP
+from src.api.http import KibanaAuth, close_http_pool, get_http
 from src.config import AppConfig
 
 CONFIG_FILE = Path(os.getenv("KIBANA_IAC_CONFIG", "kibana.iac.json"))
 
 
-def run_sync(cfg: AppConfig) -> dict[str, Any]:
+async def run_sync(cfg: AppConfig) -> dict[str, Any]:
     auth = KibanaAuth(base_url=cfg.base_url, api_key=cfg.api_key, space_id=cfg.space_id)
-    with KibanaHTTP(auth, timeout=cfg.timeout, http2=cfg.http2, verify=cfg.verify_ssl) as http:
+    http = get_http(auth, timeout=cfg.timeout, http2=cfg.http2, verify=cfg.verify_ssl)
+    try:
         api = DataViewsAPI(http)
 
         desired_specs = [
@@ -30,8 +32,10 @@ def run_sync(cfg: AppConfig) -> dict[str, Any]:
             if isinstance(item, dict) and item.get("name")
         ]
 
-        summary = api.sync(desired_specs)
+        summary = await api.sync(desired_specs)
         return summary
+    finally:
+        await close_http_pool()
 
 
 def main() -> None:
@@ -42,7 +46,7 @@ def main() -> None:
         )
 
     try:
-        summary = run_sync(cfg)
+        summary = asyncio.run(run_sync(cfg))
         print(json.dumps(summary, indent=2))
     except httpx.HTTPStatusError as e:
         sc = e.response.status_code
@@ -1,13 +1,54 @@
+import asyncio
+import hashlib
 import re
+import time
+from collections.abc import Coroutine
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import quote
 
 import httpx
+import orjson
 
 from .http import KibanaHTTP
 
+_SLUG_NONWORD = re.compile(r"\W+")
+_SLUG_REPEAT = re.compile(r"_+")
 
-@dataclass
+
+async def _run_all[T](coros: list[Coroutine[Any, Any, T]]) -> list[T]:
+    """Await coros concurrently and return their results in order.
+
+    The first failure cancels the remaining coros and is re-raised as is, so callers
+    (and main's HTTP error handling) see the original exception, not an ExceptionGroup.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+def _payload_digest(payload: dict[str, Any]) -> str:
+    """Stable content hash of a data view payload."""
+    raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _project(dv: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the fields DataViewSpec.as_payload() emits, in the same shape."""
+    out: dict[str, Any] = {"name": dv.get("name"), "title": dv.get("title")}
+    if dv.get("timeFieldName"):
+        out["timeFieldName"] = dv["timeFieldName"]
+    if dv.get("allowNoIndex"):
+        out["allowNoIndex"] = True
+    if dv.get("fieldFormats"):
+        out["fieldFormats"] = dv["fieldFormats"]
+    return out
+
+
+@dataclass(slots=True)
 class DataViewSpec:
     name: str
     title: str | None = None
@@ -21,8 +62,8 @@ class DataViewSpec:
         # Derive a reasonable default title from name if not provided
         if not self.title and self.name:
             # Lowercase, replace non-word with underscores, collapse repeats, strip underscores
-            slug = re.sub(r"\W+", "_", self.name.lower())
-            slug = re.sub(r"_+", "_", slug).strip("_")
+            slug = _SLUG_NONWORD.sub("_", self.name.lower())
+            slug = _SLUG_REPEAT.sub("_", slug).strip("_")
             derived_title = slug or self.name
         else:
             derived_title = None
@@ -46,96 +87,180 @@ class DataViewsAPI:
     UPDATE = "/api/data_views/data_view/{id}"
     DELETE = "/api/data_views/data_view/{id}"
 
+    # Upper bound on in-flight requests issued by sync()
+    MAX_CONCURRENCY = 8
+
+    # Seconds a list_views() result is reused; writes through this client invalidate it
+    LIST_TTL = 30.0
+
     def __init__(self, http: KibanaHTTP):
         self.http = http
+        self._list_cache: tuple[float, list[dict[str, Any]]] | None = None
 
     def _encode_id(self, view_id: str) -> str:
         """URL encode the view ID safely."""
-        return httpx.URL("/").copy_with(path=f"/{view_id}").path.lstrip("/")
+        return quote(view_id, safe="")
 
-    def list_views(self) -> list[dict[str, Any]]:
-        r = self.http.get(self.LIST)
+    async def list_views(self) -> list[dict[str, Any]]:
+        if self._list_cache and time.monotonic() - self._list_cache[0] < self.LIST_TTL:
+            return list(self._list_cache[1])
+        r = await self.http.get(self.LIST)
         r.raise_for_status()
-        body = r.json()
-        return body.get("data_view", []) if isinstance(body, dict) else []
+        body = orjson.loads(r.content)
+        views = body.get("data_view", []) if isinstance(body, dict) else []
+        self._list_cache = (time.monotonic(), views)
+        return list(views)
 
-    def create(self, spec: DataViewSpec, *, override: bool = False) -> dict[str, Any]:
+    async def create(self, spec: DataViewSpec, *, override: bool = False) -> dict[str, Any]:
         payload: dict[str, Any] = {"data_view": spec.as_payload()}
         if override:
             payload["override"] = True
-        r = self.http.post(self.CREATE, json=payload, xsrf=True)
+        self._list_cache = None
+        r = await self.http.post(self.CREATE, json=payload, xsrf=True)
         if r.status_code >= 400:
             raise httpx.HTTPStatusError(
                 f"Create failed: {r.status_code} {r.text}", request=r.request, response=r
             )
-        return r.json()
+        return orjson.loads(r.content)
 
-    def get(self, view_id: str) -> dict[str, Any]:
-        r = self.http.get(self.GET.format(id=self._encode_id(view_id)))
+    async def get(self, view_id: str) -> dict[str, Any]:
+        r = await self.http.get(self.GET.format(id=self._encode_id(view_id)))
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
-    def update(
+    async def update(
         self, view_id: str, spec: DataViewSpec, *, refresh_fields: bool = False
     ) -> dict[str, Any]:
         payload: dict[str, Any] = {"data_view": spec.as_payload()}
         if refresh_fields:
             payload["refresh_fields"] = True
-        r = self.http.post(self.UPDATE.format(id=self._encode_id(view_id)), json=payload, xsrf=True)
+        self._list_cache = None
+        r = await self.http.post(
+            self.UPDATE.format(id=self._encode_id(view_id)), json=payload, xsrf=True
+        )
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
-    def delete(self, view_id: str) -> None:
-        r = self.http.delete(self.DELETE.format(id=self._encode_id(view_id)), xsrf=True)
+    async def delete(self, view_id: str) -> None:
+        self._list_cache = None
+        r = await self.http.delete(self.DELETE.format(id=self._encode_id(view_id)), xsrf=True)
         if r.status_code not in (200, 202, 204, 404):
             r.raise_for_status()
 
-    def set_default(self, view_id: str, *, force: bool = True) -> dict[str, Any]:
+    async def set_default(self, view_id: str, *, force: bool = True) -> dict[str, Any]:
         payload = {"data_view_id": view_id, "force": force}
-        r = self.http.post("/api/data_views/default", json=payload, xsrf=True)
+        self._list_cache = None
+        r = await self.http.post("/api/data_views/default", json=payload, xsrf=True)
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
+
+    async def bulk_upsert(
+        self, specs: list[DataViewSpec], *, semaphore: asyncio.Semaphore | None = None
+    ) -> list[tuple[str | None, dict[str, Any]]]:
+        """Upsert many data views concurrently over the shared client.
 
-    def sync(self, desired: list[DataViewSpec]) -> dict[str, Any]:
+        Kibana has no bulk data view endpoint, so this issues one create with override per
+        spec (plus an update for specs with refresh_fields set), at most MAX_CONCURRENCY at
+        a time (pass semaphore to share that bound with other requests). With HTTP/2 the
+        requests are multiplexed over a single connection. The first failure cancels the
+        remaining upserts and is raised.
+        Returns (view_id, response) pairs in the order of specs; view_id is None when the
+        response carried no id.
+        """
+        semaphore = semaphore or asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def upsert(spec: DataViewSpec) -> tuple[str | None, dict[str, Any]]:
+            async with semaphore:
+                resp = await self.create(spec, override=True)
+                dv_obj = resp.get("data_view", {}) if isinstance(resp, dict) else {}
+                view_id = dv_obj.get("id")
+                # create(override=True) already wrote the full payload
+                if view_id and spec.refresh_fields:
+                    return view_id, await self.update(view_id, spec, refresh_fields=True)
+                return view_id, resp
+
+        return await _run_all([upsert(spec) for spec in specs])
+
+    async def sync(self, desired: list[DataViewSpec]) -> dict[str, Any]:
         """Make Kibana match the desired list of DataViewSpec.
 
         Upserts any views present in desired and deletes any existing views not present.
+        Upserts go through bulk_upsert; a follow-up update is only sent for specs with
+        refresh_fields set, to have Kibana refresh the field list.
+        Existing views whose current definition already matches the spec are skipped
+        as no_change (the list endpoint omits most fields, so each is fetched in full).
+        Fetches, upserts and deletes share one MAX_CONCURRENCY bound; the first failed
+        request cancels the others still in flight and is raised.
         Returns summary with created/updated/deleted/skipped lists.
         """
-        existing_by_name = {dv.get("name"): dv for dv in self.list_views() if isinstance(dv, dict)}
+        existing_by_name = {
+            dv.get("name"): dv for dv in await self.list_views() if isinstance(dv, dict)
+        }
         desired_names = {d.name for d in desired}
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch(view_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get(view_id)
+
+        async def delete(view_id: str) -> None:
+            async with semaphore:
+                await self.delete(view_id)
 
         created: list[dict[str, Any]] = []
         updated: list[dict[str, Any]] = []
         deleted: list[dict[str, Any]] = []
         skipped: list[dict[str, Any]] = []
 
-        first_view_id: str | None = None
+        candidates: list[DataViewSpec] = []
         for spec in desired:
             if not spec.title and spec.name not in existing_by_name:
                 skipped.append({"reason": "missing_title", "name": spec.name})
                 continue
+            candidates.append(spec)
 
-            resp = self.create(spec, override=True)
+        # refresh_fields always needs a write, so only compare the others
+        comparable = [
+            (spec, view_id)
+            for spec in candidates
+            if not spec.refresh_fields
+            and (view_id := existing_by_name.get(spec.name, {}).get("id"))
+        ]
+        current = await _run_all([fetch(view_id) for _, view_id in comparable])
+        view_ids: dict[str, str] = {}
+        for (spec, view_id), resp in zip(comparable, current):
             dv_obj = resp.get("data_view", {}) if isinstance(resp, dict) else {}
-            if view_id := dv_obj.get("id"):
-                updated.append(self.update(view_id, spec, refresh_fields=spec.refresh_fields))
-                if first_view_id is None:
-                    first_view_id = view_id
+            if _payload_digest(_project(dv_obj)) == _payload_digest(spec.as_payload()):
+                view_ids[spec.name] = view_id
+                skipped.append({"reason": "no_change", "name": spec.name, "id": view_id})
+        to_upsert = [spec for spec in candidates if spec.name not in view_ids]
+
+        # Sorted so the deleted summary is stable across runs
+        stale_names = sorted(existing_by_name.keys() - desired_names - {None, ""})
+        to_delete = [
+            (name, view_id) for name in stale_names if (view_id := existing_by_name[name].get("id"))
+        ]
+
+        upserted, *_ = await _run_all(
+            [
+                self.bulk_upsert(to_upsert, semaphore=semaphore),
+                *(delete(view_id) for _, view_id in to_delete),
+            ]
+        )
+
+        for spec, (view_id, resp) in zip(to_upsert, upserted):
+            if view_id:
+                updated.append(resp)
+                view_ids.setdefault(spec.name, view_id)
             else:
                 created.append(resp)
-                if first_view_id is None and (maybe_id := dv_obj.get("id")):
-                    first_view_id = maybe_id
-
-        for name, dv in existing_by_name.items():
-            if name and name not in desired_names and (view_id := dv.get("id")):
-                self.delete(view_id)
-                deleted.append({"id": view_id, "name": name})
+        deleted.extend({"id": view_id, "name": name} for name, view_id in to_delete)
+        first_view_id = next((view_ids[d.name] for d in desired if d.name in view_ids), None)
 
         # Set the first desired data view as default
         if first_view_id:
             try:
-                self.set_default(first_view_id, force=True)
+                await self.set_default(first_view_id, force=True)
             except Exception as e:  # noqa: BLE001
                 skipped.append({"reason": "set_default_failed", "error": str(e)})
 
@@ -1,10 +1,13 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import quote
 
 import httpx
+import orjson
 
 
-@dataclass
+@dataclass(slots=True)
 class KibanaAuth:
     base_url: str
     api_key: str
@@ -14,11 +17,26 @@ class KibanaAuth:
 class KibanaHTTP:
     """Minimal HTTP helper for Kibana API requests."""
 
+    # Sized for DataViewsAPI.sync() fan-out so connections stay warm across a run
+    LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+    # Connect-level retries only; httpx does not resend requests that reached Kibana
+    RETRIES = 2
+
     def __init__(
         self, auth: KibanaAuth, *, timeout: float = 20.0, http2: bool = True, verify: bool = True
     ):
         self.auth = auth
-        self._client = httpx.Client(timeout=timeout, http2=http2, verify=verify)
+        self._url_prefix = (
+            f"{auth.base_url}/s/{quote(auth.space_id, safe='')}" if auth.space_id else auth.base_url
+        )
+        # Shared, never mutated: _headers() copies before adding extras
+        self._base_headers = {"Authorization": self._auth_value(auth.api_key)}
+        self._xsrf_headers = {**self._base_headers, "kbn-xsrf": "true"}
+        # With an explicit transport, http2/verify/limits must be set on it, not the client
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2, verify=verify, limits=self.LIMITS, retries=self.RETRIES
+        )
+        self._client = httpx.AsyncClient(timeout=timeout, transport=transport)
 
     @staticmethod
     def _auth_value(raw: str) -> str:
@@ -32,38 +50,62 @@ class KibanaHTTP:
         return f"ApiKey {val}"
 
     def _url(self, path: str) -> str:
-        path = path if path.startswith("/") else "/" + path
-        if self.auth.space_id:
-            encoded_space = httpx.QueryParams({}).encode_component(self.auth.space_id)
-            return f"{self.auth.base_url}/s/{encoded_space}/{path.lstrip('/')}"
-        return f"{self.auth.base_url}{path}"
+        return f"{self._url_prefix}{path if path.startswith('/') else '/' + path}"
 
     def _headers(
         self, *, xsrf: bool = False, extra: dict[str, str] | None = None
     ) -> dict[str, str]:
-        headers: dict[str, str] = {"Authorization": self._auth_value(self.auth.api_key)}
-        if xsrf:
-            headers["kbn-xsrf"] = "true"
+        headers = self._xsrf_headers if xsrf else self._base_headers
         if extra:
-            headers.update(extra)
+            return {**headers, **extra}
         return headers
 
-    def get(self, path: str) -> httpx.Response:
-        return self._client.get(self._url(path), headers=self._headers())
+    async def get(self, path: str) -> httpx.Response:
+        return await self._client.get(self._url(path), headers=self._headers())
 
-    def post(
+    async def post(
         self, path: str, json: dict[str, Any] | None = None, *, xsrf: bool = True
     ) -> httpx.Response:
-        return self._client.post(self._url(path), headers=self._headers(xsrf=xsrf), json=json)
+        if json is None:
+            return await self._client.post(self._url(path), headers=self._headers(xsrf=xsrf))
+        return await self._client.post(
+            self._url(path),
+            headers=self._headers(xsrf=xsrf, extra={"Content-Type": "application/json"}),
+            content=orjson.dumps(json),
+        )
 
-    def delete(self, path: str, *, xsrf: bool = True) -> httpx.Response:
-        return self._client.delete(self._url(path), headers=self._headers(xsrf=xsrf))
+    async def delete(self, path: str, *, xsrf: bool = True) -> httpx.Response:
+        return await self._client.delete(self._url(path), headers=self._headers(xsrf=xsrf))
 
-    def close(self) -> None:
-        self._client.close()
+    async def close(self) -> None:
+        await self._client.aclose()
 
-    def __enter__(self) -> "KibanaHTTP":
+    async def __aenter__(self) -> "KibanaHTTP":
         return self
 
-    def __exit__(self, exc_type, exc, tb) -> None:
-        self.close()
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+# Shared clients by (base_url, api_key, space_id); see get_http()
+_HTTP_POOL: dict[tuple[str, str, str | None], KibanaHTTP] = {}
+
+
+def get_http(auth: KibanaAuth, **kwargs: Any) -> KibanaHTTP:
+    """Return the shared KibanaHTTP for auth, creating it on first use.
+
+    kwargs are only applied when the client is created. Clients are bound to the running
+    event loop, so call close_http_pool() before that loop exits.
+    """
+    key = (auth.base_url, auth.api_key, auth.space_id)
+    http = _HTTP_POOL.get(key)
+    if http is None:
+        http = _HTTP_POOL[key] = KibanaHTTP(auth, **kwargs)
+    return http
+
+
+async def close_http_pool() -> None:
+    """Close and forget every client handed out by get_http()."""
+    clients = list(_HTTP_POOL.values())
+    _HTTP_POOL.clear()
+    await asyncio.gather(*(http.close() for http in clients))
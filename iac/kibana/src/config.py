@@ -1,8 +1,12 @@
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+# Parsed configs by path, reused while the file's mtime is unchanged
+_CFG_CACHE: dict[str, tuple[int, "AppConfig"]] = {}
+
 
 @dataclass
 class AppConfig:
@@ -33,16 +37,21 @@ class AppConfig:
                     }
                 ],
             }
-            path.write_text(json.dumps(template, indent=2))
+            path.write_bytes(orjson.dumps(template, option=orjson.OPT_INDENT_2))
             raise SystemExit(
                 f"Config template created at {path}. Please review and set kibana.api_key, then re-run."
             )
 
-        cfg = json.loads(path.read_text())
+        key, mtime_ns = str(path), path.stat().st_mtime_ns
+        cached = _CFG_CACHE.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        cfg = orjson.loads(path.read_bytes())
         kib = cfg.get("kibana", {})
         data_views = cfg.get("data_views", [])
 
-        return AppConfig(
+        config = AppConfig(
             base_url=str(kib.get("base_url", "")).rstrip("/"),
             api_key=str(kib.get("api_key", "")),
             space_id=kib.get("space_id"),
@@ -51,3 +60,5 @@ class AppConfig:
             verify_ssl=bool(kib.get("verify_ssl", False)),
             data_views=data_views if isinstance(data_views, list) else [],
         )
+        _CFG_CACHE[key] = (mtime_ns, config)
+        return config
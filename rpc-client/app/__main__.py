@@ -0,0 +1,23 @@
+"""Run the API under uvicorn with ``python -m app``.
+
+Kept apart from app.main so the application (and its tracing and logging setup)
+is only built once, by uvicorn importing ``app.main:app``.
+"""
+
+import uvicorn
+
+from .core.config import get_settings
+
+if __name__ == "__main__":
+    settings = get_settings()
+    uvicorn.run(
+        "app.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.api_workers,
+        # Reload runs a single process and can't be combined with workers
+        reload=settings.api_reload and settings.api_workers == 1,
+        http="httptools",
+        loop="uvloop",
+        log_level=settings.log_level.lower(),
+    )
@@ -1,7 +1,14 @@
 """API package initialization."""
 
+from fastapi import APIRouter
+
 from .health import router as health_router
 from .test import router as test_router
 from .v1 import users_router
 
-__all__ = ["health_router", "test_router", "users_router"]
+api_router = APIRouter()
+api_router.include_router(health_router)
+api_router.include_router(test_router, prefix="/v1")
+api_router.include_router(users_router, prefix="/v1")
+
+__all__ = ["api_router", "health_router", "test_router", "users_router"]
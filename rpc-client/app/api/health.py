@@ -1,24 +1,50 @@
-from fastapi import APIRouter, Request
+import orjson
+from fastapi import APIRouter, Request, Response
 
-from ..core.config import settings
+from ..core.config import get_settings
 from ..models import HealthResponse
 
 router = APIRouter(tags=["health"])
 
 
+def _health_body(status: str) -> bytes:
+    settings = get_settings()
+    return orjson.dumps(
+        HealthResponse(
+            status=status,
+            service=settings.app_name,
+            version=settings.app_version,
+            grpc_user_status=status,
+        ).model_dump()
+    )
+
+
+# Serialized once at import; probes only pick which body to send
+_HEALTHY_BODY = _health_body("healthy")
+_UNHEALTHY_BODY = _health_body("unhealthy")
+_ALIVE_BODY = orjson.dumps({"status": "alive"})
+
+
+@router.get(
+    "/livez",
+    summary="Liveness check",
+    description="Report that the API process is serving; never checks the gRPC backend",
+)
+async def liveness_check() -> Response:
+    return Response(content=_ALIVE_BODY, media_type="application/json")
+
+
 @router.get(
     "/healthz",
     response_model=HealthResponse,
     summary="Health check",
-    description="Check the health status of the API service",
+    description="Readiness check; returns 503 while the gRPC backend is unreachable",
+    responses={503: {"description": "gRPC backend unavailable"}},
 )
-async def health_check(request: Request) -> HealthResponse:
+async def health_check(request: Request) -> Response:
     grpc_client = request.app.state.grpc_client
-    grpc_user_status = "healthy" if await grpc_client.health_check() else "unhealthy"
-
-    return HealthResponse(
-        status="healthy",
-        service=settings.app_name,
-        version=settings.app_version,
-        grpc_user_status=grpc_user_status,
+    if await grpc_client.health_check():
+        return Response(content=_HEALTHY_BODY, media_type="application/json")
+    return Response(
+        content=_UNHEALTHY_BODY, media_type="application/json", status_code=503
     )
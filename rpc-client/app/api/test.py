@@ -4,16 +4,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Request
 
-from ..grpc_client import AsyncUserGRPCClient
 from ..models import MessageResponse
 from ..services import TestService
 
 router = APIRouter(tags=["test"])
 
 
-def get_test_service(request: Request) -> TestService:
-    grpc_client: AsyncUserGRPCClient = request.app.state.grpc_client
-    return TestService(grpc_client)
+async def get_test_service(request: Request) -> TestService:
+    return request.app.state.test_service
 
 
 @router.get(
@@ -4,7 +4,6 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request
 
-from ...grpc_client import AsyncUserGRPCClient
 from ...models import (
     MessageResponse,
     UserCreate,
@@ -17,9 +16,8 @@ from ...services import UserService
 router = APIRouter(tags=["users"])
 
 
-def get_user_service(request: Request) -> UserService:
-    grpc_client: AsyncUserGRPCClient = request.app.state.grpc_client
-    return UserService(grpc_client)
+async def get_user_service(request: Request) -> UserService:
+    return request.app.state.user_service
 
 
 @router.post(
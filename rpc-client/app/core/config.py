@@ -1,3 +1,6 @@
+import os
+from functools import cached_property, lru_cache
+
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,16 +13,38 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="forbid",
+        frozen=True,
     )
 
     # Server settings
     grpc_host: str = Field(default="localhost", description="gRPC server host")
     grpc_port: int = Field(default=50051, description="gRPC server port")
+    grpc_pool_size: int = Field(
+        default=4, ge=1, description="Number of gRPC channels to round-robin over"
+    )
+    grpc_keepalive_time_ms: int = Field(
+        default=30000, description="Interval between gRPC keepalive pings"
+    )
+    grpc_keepalive_timeout_ms: int = Field(
+        default=10000, description="Time to wait for a keepalive ping ack"
+    )
+    grpc_min_time_between_pings_ms: int = Field(
+        default=10000, description="Minimum interval between HTTP/2 pings"
+    )
+    grpc_max_receive_message_length: int = Field(
+        default=16 * 1024 * 1024, description="Largest gRPC response accepted"
+    )
+    grpc_initial_reconnect_backoff_ms: int = Field(
+        default=100, description="First delay before reconnecting a dropped channel"
+    )
 
     # API settings
     api_host: str = Field(default="0.0.0.0", description="API server host")
     api_port: int = Field(default=8000, description="API server port")
     api_reload: bool = Field(default=False, description="Enable API auto-reload")
+    api_workers: int = Field(
+        default=1, ge=1, description="Number of API worker processes"
+    )
 
     # Application settings
     app_name: str = Field(default="User gRPC Client", description="Application name")
@@ -29,12 +54,31 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
 
+    # Tracing
+    otel_enabled: bool = Field(
+        default=False, description="Enable OpenTelemetry tracing and span export"
+    )
+    otel_endpoint: str = Field(
+        default="localhost:4317", description="OTLP gRPC collector endpoint"
+    )
+    trace_sample_rate: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Ratio of new traces to sample"
+    )
+
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def grpc_address(self) -> str:
         """Get the complete gRPC server address."""
         return f"{self.grpc_host}:{self.grpc_port}"
 
 
-# Create settings instance - will read from environment variables or use defaults
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once.
+
+    Inside Kubernetes (or with APP_SKIP_DOTENV set) the environment is
+    authoritative, so the .env file is not looked up at all.
+    """
+    if os.getenv("KUBERNETES_SERVICE_HOST") or os.getenv("APP_SKIP_DOTENV"):
+        return Settings(_env_file=None)
+    return Settings()
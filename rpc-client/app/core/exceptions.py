@@ -1,5 +1,6 @@
-from typing import Protocol
+from typing import Protocol, cast
 
+import grpc
 from fastapi import HTTPException
 
 
@@ -28,12 +29,20 @@ class GRPCTimeoutError(GRPCClientError):
     pass
 
 
-def grpc_to_http_exception(grpc_error: Exception) -> HTTPException:
-    """Convert gRPC errors to HTTP exceptions."""
-    from typing import cast
+# gRPC status -> (HTTP status, detail override); None keeps the gRPC details
+_GRPC_TO_HTTP: dict[grpc.StatusCode, tuple[int, str | None]] = {
+    grpc.StatusCode.NOT_FOUND: (404, None),
+    grpc.StatusCode.ALREADY_EXISTS: (409, None),
+    grpc.StatusCode.INVALID_ARGUMENT: (400, None),
+    grpc.StatusCode.UNAVAILABLE: (503, "gRPC service unavailable"),
+    grpc.StatusCode.DEADLINE_EXCEEDED: (504, "Request timeout"),
+    grpc.StatusCode.PERMISSION_DENIED: (403, "Permission denied"),
+    grpc.StatusCode.UNAUTHENTICATED: (401, "Authentication required"),
+}
 
-    import grpc
 
+def grpc_to_http_exception(grpc_error: Exception) -> HTTPException:
+    """Convert gRPC errors to HTTP exceptions."""
     if not isinstance(grpc_error, grpc.RpcError):
         return HTTPException(status_code=500, detail="Internal server error")
 
@@ -46,20 +55,9 @@ def grpc_to_http_exception(grpc_error: Exception) -> HTTPException:
     status_code = typed_error.code()
     detail = typed_error.details()
 
-    match status_code:
-        case grpc.StatusCode.NOT_FOUND:
-            return HTTPException(status_code=404, detail=detail)
-        case grpc.StatusCode.ALREADY_EXISTS:
-            return HTTPException(status_code=409, detail=detail)
-        case grpc.StatusCode.INVALID_ARGUMENT:
-            return HTTPException(status_code=400, detail=detail)
-        case grpc.StatusCode.UNAVAILABLE:
-            return HTTPException(status_code=503, detail="gRPC service unavailable")
-        case grpc.StatusCode.DEADLINE_EXCEEDED:
-            return HTTPException(status_code=504, detail="Request timeout")
-        case grpc.StatusCode.PERMISSION_DENIED:
-            return HTTPException(status_code=403, detail="Permission denied")
-        case grpc.StatusCode.UNAUTHENTICATED:
-            return HTTPException(status_code=401, detail="Authentication required")
-        case _:
-            return HTTPException(status_code=500, detail="Internal server error")
+    mapping = _GRPC_TO_HTTP.get(status_code)
+    if mapping is None:
+        return HTTPException(status_code=500, detail="Internal server error")
+
+    http_status, override = mapping
+    return HTTPException(status_code=http_status, detail=override or detail)
@@ -1,13 +1,45 @@
+import atexit
 import logging
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
 
-from .config import settings
+from .config import get_settings
 
+# Set by the first setup_logging() call; later calls reuse it
+_listener: QueueListener | None = None
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() renders the message and traceback on the emitting thread
+    so records can be pickled; an in-process SimpleQueue never pickles, so the
+    record is queued as is and the listener's handler formats it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging() -> QueueListener:
+    """Configure unified logging with OpenTelemetry trace context correlation
+
+    Records are queued unformatted by the emitting thread; a background
+    listener formats them and writes to stdout, keeping both off the event loop.
+    Safe to call more than once: only the first call configures anything.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    # The format below never uses these, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
-def setup_logging():
-    """Configure unified logging with OpenTelemetry trace context correlation"""
     LoggingInstrumentor().instrument(set_logging_format=True)
 
     formatter = logging.Formatter(
@@ -15,11 +47,18 @@ def setup_logging():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = _DeferredFormatQueueHandler(log_queue)
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Drain the queue after uvicorn's final shutdown messages
+    atexit.register(listener.stop)
 
     loggers = ["", "uvicorn", "uvicorn.error", "fastapi"]
-    level = getattr(logging, settings.log_level.upper())
+    level = getattr(logging, get_settings().log_level.upper())
 
     for logger_name in loggers:
         logger = logging.getLogger(logger_name)
@@ -31,6 +70,9 @@ def setup_logging():
 
     logging.getLogger("uvicorn.access").disabled = True
 
+    _listener = listener
+    return listener
+
 
 def create_access_log_middleware():
     access_logger = logging.getLogger("app.access")
@@ -38,10 +80,15 @@ def create_access_log_middleware():
     async def access_log_middleware(request, call_next):
         response = await call_next(request)
 
-        client = request.client.host if request.client else "unknown"
-        access_logger.info(
-            f'{client} "{request.method} {request.url.path}" {response.status_code}'
-        )
+        if access_logger.isEnabledFor(logging.INFO):
+            client = request.client.host if request.client else "unknown"
+            access_logger.info(
+                '%s "%s %s" %d',
+                client,
+                request.method,
+                request.url.path,
+                response.status_code,
+            )
 
         return response
 
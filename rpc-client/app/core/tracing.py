@@ -0,0 +1,37 @@
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+from .config import get_settings
+
+# Set by the first setup_tracing() call; later calls reuse it
+_provider: TracerProvider | None = None
+
+
+def setup_tracing() -> TracerProvider:
+    """Install a sampled tracer provider that batches spans to the OTLP collector
+
+    Safe to call more than once: only the first call creates a provider and exporter.
+    """
+    global _provider
+    if _provider is not None:
+        return _provider
+
+    settings = get_settings()
+    provider = TracerProvider(
+        sampler=ParentBased(TraceIdRatioBased(settings.trace_sample_rate)),
+        resource=Resource.create(
+            {"service.name": settings.app_name, "service.version": settings.app_version}
+        ),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=settings.otel_endpoint, insecure=True)
+        )
+    )
+    trace.set_tracer_provider(provider)
+    _provider = provider
+    return provider
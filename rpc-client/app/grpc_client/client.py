@@ -1,34 +1,94 @@
+import asyncio
 import logging
-import sys
-from pathlib import Path
+from collections.abc import Sequence
 
+import grpc
 from grpc import aio
-from opentelemetry.instrumentation.grpc import GrpcAioInstrumentorClient
 
-from ..core.config import settings
+from proto.user_pb2_grpc import UserServiceStub
+
+from ..core.config import get_settings
 from ..core.exceptions import (
     GRPCClientError,
     GRPCServiceUnavailableError,
 )
 
-client_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(client_dir))
+logger = logging.getLogger(__name__)
 
-from proto.user_pb2_grpc import UserServiceStub  # noqa: E402
+# IDLE and CONNECTING still count as healthy: is_healthy() kicks IDLE channels into a
+# reconnect, so a lost backend surfaces as TRANSIENT_FAILURE on the next probe
+_UNHEALTHY_STATES = frozenset(
+    (grpc.ChannelConnectivity.TRANSIENT_FAILURE, grpc.ChannelConnectivity.SHUTDOWN)
+)
 
-logger = logging.getLogger(__name__)
+
+class ChannelPool:
+    """Fixed-size pool of gRPC channels with round-robin stub selection."""
+
+    def __init__(
+        self,
+        address: str,
+        pool_size: int,
+        options: Sequence[tuple[str, int]] | None = None,
+    ) -> None:
+        self._channels = [
+            aio.insecure_channel(address, options=options) for _ in range(pool_size)
+        ]
+        self._stubs = [UserServiceStub(channel) for channel in self._channels]
+        self._idx = 0
+
+    def next_stub(self) -> UserServiceStub:
+        """Return the stub of the next channel in the rotation."""
+        stub = self._stubs[self._idx]
+        self._idx = (self._idx + 1) % len(self._stubs)
+        return stub
+
+    async def channel_ready(self) -> None:
+        """Wait until every channel in the pool is ready."""
+        await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
+
+    def is_healthy(self) -> bool:
+        """Check that no channel is failing, nudging IDLE channels to reconnect.
+
+        After the backend goes away gRPC parks channels in IDLE until something asks
+        them to connect; try_to_connect=True starts that reconnect without blocking
+        or creating a channel, so an outage shows up as TRANSIENT_FAILURE.
+        """
+        return not any(
+            channel.get_state(try_to_connect=True) in _UNHEALTHY_STATES
+            for channel in self._channels
+        )
+
+    async def close(self) -> None:
+        await asyncio.gather(*(channel.close() for channel in self._channels))
 
 
 class AsyncUserGRPCClient:
     def __init__(self) -> None:
-        grpc_client_instrumentor = GrpcAioInstrumentorClient()
-        grpc_client_instrumentor.instrument()
-
-        self._host = settings.grpc_host
-        self._port = settings.grpc_port
-        self._address = f"{self._host}:{self._port}"
-        self._channel: aio.Channel | None = None
-        self._stub: UserServiceStub | None = None
+        settings = get_settings()
+        self._address = settings.grpc_address
+        self._pool_size = settings.grpc_pool_size
+        self._options = [
+            # Give each pooled channel its own subchannel (TCP connection)
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.keepalive_time_ms", settings.grpc_keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", settings.grpc_keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            (
+                "grpc.http2.min_time_between_pings_ms",
+                settings.grpc_min_time_between_pings_ms,
+            ),
+            (
+                "grpc.max_receive_message_length",
+                settings.grpc_max_receive_message_length,
+            ),
+            (
+                "grpc.initial_reconnect_backoff_ms",
+                settings.grpc_initial_reconnect_backoff_ms,
+            ),
+        ]
+        self._pool: ChannelPool | None = None
 
     async def __aenter__(self) -> "AsyncUserGRPCClient":
         """Async context manager entry."""
@@ -41,11 +101,13 @@ class AsyncUserGRPCClient:
 
     async def connect(self) -> None:
         try:
-            self._channel = aio.insecure_channel(self._address)
-            self._stub = UserServiceStub(self._channel)
-            # Try to make a dummy call to ensure connection is healthy
-            await self._channel.channel_ready()
-            logger.debug(f"Connected to gRPC server at {self._address}")
+            self._pool = ChannelPool(self._address, self._pool_size, self._options)
+            # Wait for every channel so the first RPCs don't pay the handshake
+            await self._pool.channel_ready()
+            logger.debug(
+                f"Connected to gRPC server at {self._address} "
+                f"with {self._pool_size} channels"
+            )
         except Exception as e:
             logger.error(f"Failed to connect to gRPC server at {self._address}: {e}")
             raise GRPCServiceUnavailableError(
@@ -53,31 +115,27 @@ class AsyncUserGRPCClient:
             ) from e
 
     async def close(self) -> None:
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
-            self._stub = None
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
             logger.info("gRPC connection closed")
 
     @property
     def stub(self) -> UserServiceStub:
-        """Get the gRPC stub, connecting if necessary."""
-        if not self._stub:
+        """Get the gRPC stub of the next pooled channel."""
+        if not self._pool:
             raise GRPCClientError(
                 "gRPC client not connected. Use 'await connect()' first."
             )
-        return self._stub
+        return self._pool.next_stub()
 
     @property
     def is_connected(self) -> bool:
         """Check if client is connected."""
-        return self._stub is not None and self._channel is not None
+        return self._pool is not None
 
     async def health_check(self) -> bool:
-        """Perform a basic health check."""
-        try:
-            await self.connect()
-            return True
-        except Exception as e:
-            logger.warning(f"Health check failed: {e}")
+        """Report whether the pooled channels are usable, without blocking."""
+        if not self._pool:
             return False
+        return self._pool.is_healthy()
@@ -2,30 +2,44 @@ import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from opentelemetry import trace
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.instrumentation.grpc import GrpcAioInstrumentorClient
 
-from .api import health_router, test_router, users_router
-from .core.config import settings
+from .api import api_router
+from .core.config import get_settings
 from .core.logging import create_access_log_middleware, setup_logging
+from .core.tracing import setup_tracing
 from .grpc_client.client import AsyncUserGRPCClient
+from .services import TestService, UserService
+
+settings = get_settings()
 
 # Setup logging first
 setup_logging()
 logger = logging.getLogger(__name__)
 
-trace.set_tracer_provider(TracerProvider())
+# Docs and probe endpoints don't need spans
+TRACING_EXCLUDED_URLS = "/docs,/redoc,/openapi.json,/healthz,/livez"
+
+# Exception details are logged server-side, never returned to the caller
+INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error"})
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting up FastAPI app...")
+    if settings.otel_enabled:
+        # Instrument grpc.aio once, before any channel is created
+        GrpcAioInstrumentorClient().instrument(tracer_provider=setup_tracing())
     grpc_client = AsyncUserGRPCClient()
     await grpc_client.connect()
     app.state.grpc_client = grpc_client
+    # Services are stateless wrappers around the client; share one of each
+    app.state.user_service = UserService(grpc_client)
+    app.state.test_service = TestService(grpc_client)
     logger.info("gRPC client connected.")
 
     try:
@@ -43,29 +57,34 @@ def create_app() -> FastAPI:
         description="FastAPI client for User gRPC service",
         version=settings.app_version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
-    FastAPIInstrumentor.instrument_app(app)
+    if settings.otel_enabled:
+        FastAPIInstrumentor.instrument_app(
+            app,
+            tracer_provider=setup_tracing(),
+            excluded_urls=TRACING_EXCLUDED_URLS,
+        )
 
     # Add access logging middleware
     app.middleware("http")(create_access_log_middleware())
 
     @app.exception_handler(Exception)
-    async def global_exception_handler(
-        request: Request, exc: Exception
-    ) -> JSONResponse:
+    async def global_exception_handler(request: Request, exc: Exception) -> Response:
         logger.error(
-            f"Unhandled exception on {request.method} {request.url}: {exc}",
+            "Unhandled exception on %s %s: %s",
+            request.method,
+            request.url,
+            exc,
             exc_info=True,
         )
-        return JSONResponse(
-            status_code=500, content={"detail": f"Internal server error: {str(exc)}"}
+        return Response(
+            content=INTERNAL_ERROR_BODY, media_type="application/json", status_code=500
         )
 
-    app.include_router(health_router)
-    app.include_router(test_router, prefix="/v1")
-    app.include_router(users_router, prefix="/v1")
+    app.include_router(api_router)
 
     return app
 
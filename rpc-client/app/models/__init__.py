@@ -15,7 +15,7 @@ __all__ = [
     "MessageResponse",
     "UserBase",
     "UserCreate",
-    "UserUpdate",
-    "UserResponse",
     "UserListResponse",
+    "UserResponse",
+    "UserUpdate",
 ]
@@ -1,11 +1,18 @@
 """Business logic service for user operations."""
 
 import logging
-import sys
-from pathlib import Path
 
 import grpc
 
+from proto.user_pb2 import (
+    CreateUserRequest,
+    DeleteUserRequest,
+    GetUserRequest,
+    ListUsersRequest,
+    UpdateUserRequest,
+    User,
+)
+
 from ..core.exceptions import grpc_to_http_exception
 from ..grpc_client import AsyncUserGRPCClient
 from ..models import (
@@ -16,18 +23,6 @@ from ..models import (
     UserUpdate,
 )
 
-client_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(client_dir))
-
-from proto.user_pb2 import (  # noqa: E402
-    CreateUserRequest,
-    DeleteUserRequest,
-    GetUserRequest,
-    ListUsersRequest,
-    UpdateUserRequest,
-    User,
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -45,7 +40,7 @@ class UserService:
             response = await self.grpc_client.stub.CreateUser(request)
             return self._grpc_user_to_pydantic(response.user)
         except grpc.RpcError as e:
-            logger.error(f"gRPC error creating user: {e}")
+            logger.error("gRPC error creating user: %s", e)
             raise grpc_to_http_exception(e) from e
 
     async def get_user(self, user_id: str) -> UserResponse:
@@ -54,21 +49,19 @@ class UserService:
             response = await self.grpc_client.stub.GetUser(request)
             return self._grpc_user_to_pydantic(response.user)
         except grpc.RpcError as e:
-            logger.error(f"gRPC error getting user {user_id}: {e}")
+            logger.error("gRPC error getting user %s: %s", user_id, e)
             raise grpc_to_http_exception(e) from e
 
     async def update_user(self, user_id: str, user_data: UserUpdate) -> UserResponse:
         try:
+            # Omitted fields keep their proto3 zero value, which the server ignores
             request = UpdateUserRequest(
-                id=user_id,
-                name=user_data.name or "",
-                email=user_data.email or "",
-                age=user_data.age or 0,
+                id=user_id, **user_data.model_dump(exclude_none=True)
             )
             response = await self.grpc_client.stub.UpdateUser(request)
             return self._grpc_user_to_pydantic(response.user)
         except grpc.RpcError as e:
-            logger.error(f"gRPC error updating user {user_id}: {e}")
+            logger.error("gRPC error updating user %s: %s", user_id, e)
             raise grpc_to_http_exception(e) from e
 
     async def delete_user(self, user_id: str) -> MessageResponse:
@@ -77,7 +70,7 @@ class UserService:
             response = await self.grpc_client.stub.DeleteUser(request)
             return MessageResponse(message=response.message)
         except grpc.RpcError as e:
-            logger.error(f"gRPC error deleting user {user_id}: {e}")
+            logger.error("gRPC error deleting user %s: %s", user_id, e)
             raise grpc_to_http_exception(e) from e
 
     async def list_users(self, page: int = 1, limit: int = 10) -> UserListResponse:
@@ -85,18 +78,31 @@ class UserService:
             request = ListUsersRequest(page=page, limit=limit)
             response = await self.grpc_client.stub.ListUsers(request)
 
-            users = [self._grpc_user_to_pydantic(user) for user in response.users]
-            return UserListResponse(
+            # Single pass over the protobuf rows, no per-row method dispatch
+            construct = UserResponse.model_construct
+            users = [
+                construct(
+                    id=user.id,
+                    name=user.name,
+                    email=user.email,
+                    age=user.age,
+                    created_at=user.created_at,
+                    updated_at=user.updated_at,
+                )
+                for user in response.users
+            ]
+            return UserListResponse.model_construct(
                 users=users,
                 total=response.total,
                 message=response.message,
             )
         except grpc.RpcError as e:
-            logger.error(f"gRPC error listing users: {e}")
+            logger.error("gRPC error listing users: %s", e)
             raise grpc_to_http_exception(e) from e
 
     def _grpc_user_to_pydantic(self, grpc_user: User) -> UserResponse:
-        return UserResponse(
+        # Server data is already validated; skip re-running field validators
+        return UserResponse.model_construct(
             id=grpc_user.id,
             name=grpc_user.name,
             email=grpc_user.email,
@@ -0,0 +1 @@
+"""Generated protobuf and gRPC modules for the User service."""
@@ -8,9 +8,11 @@ import (
 	"os"
 	"os/signal"
 	"syscall"
+	"time"
 
 	"go.opentelemetry.io/contrib/instrumentation/google.golang.org/grpc/otelgrpc"
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/keepalive"
 	"google.golang.org/grpc/reflection"
 
 	"grpc-server/internal/cache"
@@ -79,6 +81,11 @@ func main() {
 	grpcOpts := []grpc.ServerOption{
 		grpc.MaxRecvMsgSize(cfg.Server.MaxRecvMsgSize),
 		grpc.MaxSendMsgSize(cfg.Server.MaxSendMsgSize),
+		// Accept the rpc-client's idle keepalive pings instead of answering with GOAWAY
+		grpc.KeepaliveEnforcementPolicy(keepalive.EnforcementPolicy{
+			MinTime:             10 * time.Second,
+			PermitWithoutStream: true,
+		}),
 	}
 
 	// Add tracing interceptors if enabled